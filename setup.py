@@ -22,6 +22,9 @@ setup(
             "black>=23.0.0",
             "mypy>=1.5.0",
         ],
+        "fast": [
+            "orjson>=3.9.0",
+        ],
         "analyst": [
             "jupyter>=1.0.0",
             "matplotlib>=3.7.0",
@@ -17,6 +17,12 @@ try:
 except ImportError:
     raise ImportError("MCP SDK not installed. Please install with: pip install mcp")
 
+# Optional faster JSON decoder (pip install kdm-sdk[fast])
+try:
+    import orjson
+except ImportError:
+    orjson = None  # type: ignore[assignment]
+
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -28,6 +34,17 @@ DEFAULT_TIMEOUT = 30.0  # seconds
 CONNECTION_TIMEOUT = 10.0  # seconds
 
 
+def _json_loads(text: Union[str, bytes]) -> Any:
+    """Decode a JSON tool response, using orjson when it is installed"""
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            # orjson rejects NaN/Infinity literals, which the stdlib accepts
+            pass
+    return json.loads(text)
+
+
 class KDMClient:
     """
     KDM MCP Client for Python
@@ -190,7 +207,7 @@ class KDMClient:
                 content_block = result.content[0]
                 if hasattr(content_block, "text"):
                     try:
-                        parsed = json.loads(content_block.text)
+                        parsed = _json_loads(content_block.text)
                         logger.debug(
                             f"[KDM Client] Tool '{name}' parsed result keys: {parsed.keys() if isinstance(parsed, dict) else type(parsed)}"
                         )
@@ -236,6 +253,7 @@ class KDMClient:
         include_quality: bool = False,
         include_safety: bool = False,
         include_related: bool = False,
+        count_only: bool = False,
     ) -> Dict[str, Any]:
         """
         Get water data from KDM
@@ -256,56 +274,56 @@ class KDMClient:
             include_quality: Include water quality data
             include_safety: Include dam safety data
             include_related: Include related facility data
+            count_only: Return len(data) as "total_count" in place of the
+                "data" records. A convenience for callers that only need the
+                count; the full response is still transferred and parsed.
 
         Returns:
             Dictionary with query results
         """
+        # Build the arguments shared by every attempt once
+        args: Dict[str, Any] = {
+            "site_name": site_name,
+            "days": days,
+        }
+
+        if facility_type:
+            args["facility_type"] = facility_type
+        if measurement_items:
+            args["measurement_items"] = measurement_items
+        if start_date:
+            args["start_date"] = start_date
+        if end_date:
+            args["end_date"] = end_date
+
+        # Add boolean flags
+        flags = {
+            "include_comparison": include_comparison,
+            "include_flood": include_flood,
+            "include_drought": include_drought,
+            "include_discharge": include_discharge,
+            "include_weather": include_weather,
+            "include_quality": include_quality,
+            "include_safety": include_safety,
+            "include_related": include_related,
+        }
+        args.update({flag: True for flag, enabled in flags.items() if enabled})
+
         # Auto-fallback logic for time_key
         if time_key == "auto":
             # Try in order: h_1 -> d_1 -> mt_1
             for tk in ["h_1", "d_1", "mt_1"]:
                 try:
-                    args = {
-                        "site_name": site_name,
-                        "days": days,
-                        "time_key": tk,
-                    }
-
-                    if facility_type:
-                        args["facility_type"] = facility_type
-                    if measurement_items:
-                        args["measurement_items"] = measurement_items
-                    if start_date:
-                        args["start_date"] = start_date
-                    if end_date:
-                        args["end_date"] = end_date
-
-                    # Add boolean flags
-                    if include_comparison:
-                        args["include_comparison"] = True
-                    if include_flood:
-                        args["include_flood"] = True
-                    if include_drought:
-                        args["include_drought"] = True
-                    if include_discharge:
-                        args["include_discharge"] = True
-                    if include_weather:
-                        args["include_weather"] = True
-                    if include_quality:
-                        args["include_quality"] = True
-                    if include_safety:
-                        args["include_safety"] = True
-                    if include_related:
-                        args["include_related"] = True
-
-                    result = await self._call_tool("get_kdm_data", args)
+                    result = await self._call_tool(
+                        "get_kdm_data", {**args, "time_key": tk}
+                    )
 
                     if result and result.get("success") and result.get("data"):
                         logger.info(
                             f"[KDM Client] Auto-fallback succeeded with time_key: {tk}"
                         )
                         result["used_time_key"] = tk
-                        return result
+                        return self._count_only(result) if count_only else result
 
                 except Exception as e:
                     logger.debug(
@@ -318,41 +336,18 @@ class KDMClient:
             return {"success": False, "message": "No data found with auto-fallback"}
 
         # Normal call (no auto-fallback)
-        args = {
-            "site_name": site_name,
-            "days": days,
-        }
-
-        if facility_type:
-            args["facility_type"] = facility_type
-        if measurement_items:
-            args["measurement_items"] = measurement_items
         if time_key:
             args["time_key"] = time_key
-        if start_date:
-            args["start_date"] = start_date
-        if end_date:
-            args["end_date"] = end_date
 
-        # Add boolean flags
-        if include_comparison:
-            args["include_comparison"] = True
-        if include_flood:
-            args["include_flood"] = True
-        if include_drought:
-            args["include_drought"] = True
-        if include_discharge:
-            args["include_discharge"] = True
-        if include_weather:
-            args["include_weather"] = True
-        if include_quality:
-            args["include_quality"] = True
-        if include_safety:
-            args["include_safety"] = True
-        if include_related:
-            args["include_related"] = True
-
-        return await self._call_tool("get_kdm_data", args)
+        result = await self._call_tool("get_kdm_data", args)
+        return self._count_only(result) if count_only else result
+
+    @staticmethod
+    def _count_only(result: Any) -> Any:
+        """Swap the data records in a result for a total_count field"""
+        if isinstance(result, dict) and isinstance(result.get("data"), list):
+            result["total_count"] = len(result.pop("data"))
+        return result
 
     async def search_facilities(
         self, query: str, facility_type: Optional[str] = None, limit: int = 10
@@ -593,9 +588,8 @@ class KDMClient:
 
         # Parse result - handle both string and dict responses
         if isinstance(result, str):
-            import json
             try:
-                result = json.loads(result)
+                result = _json_loads(result)
             except json.JSONDecodeError:
                 logger.warning(f"Failed to parse {tool_name} response as JSON")
                 return None
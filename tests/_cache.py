@@ -0,0 +1,78 @@
+"""
+On-disk response cache for test scripts
+
+Memoizes successful get_water_data responses so re-running a probe script
+with unchanged parameters is served locally instead of hitting the server.
+Delete the ``.kdm_test_cache*`` files in the repository root to reset it.
+
+The cache is best effort: each pytest-xdist worker gets its own file, since
+shelve does no locking, and any error reading or writing it falls through
+to the server instead of failing the probe.
+"""
+
+import dbm
+import hashlib
+import json
+import os
+import pickle
+import shelve
+import time
+from pathlib import Path
+from typing import Any, Dict
+
+_WORKER = os.environ.get("PYTEST_XDIST_WORKER")
+CACHE_PATH = str(
+    Path(__file__).parent.parent
+    / (f".kdm_test_cache-{_WORKER}" if _WORKER else ".kdm_test_cache")
+)
+CACHE_EXPIRE = 3600  # seconds
+
+# A locked, truncated or corrupt shelf raises one of these
+CACHE_ERRORS = (*dbm.error, EOFError, ValueError, pickle.PickleError)
+
+
+def _cache_key(server_url: str, kwargs: Dict[str, Any]) -> str:
+    """Build a stable key from the server URL and query arguments"""
+    payload = json.dumps(
+        {"server_url": server_url, **kwargs}, sort_keys=True, ensure_ascii=False
+    )
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+async def cached_get_water_data(client, **kwargs) -> Dict[str, Any]:
+    """
+    Call client.get_water_data, serving repeated queries from disk
+
+    Only successful responses are cached, so transient failures are retried
+    on the next run. Entries expire after CACHE_EXPIRE seconds. If the cache
+    file cannot be read or written the query goes to the server as usual.
+
+    Args:
+        client: Connected KDMClient
+        **kwargs: Passed through to get_water_data
+
+    Returns:
+        Query result dictionary
+    """
+    key = _cache_key(client.server_url, kwargs)
+
+    try:
+        with shelve.open(CACHE_PATH) as cache:
+            entry = cache.get(key)
+    except CACHE_ERRORS:
+        entry = None
+    if entry is not None:
+        stored_at, result = entry
+        if time.time() - stored_at < CACHE_EXPIRE:
+            return result
+
+    result = await client.get_water_data(**kwargs)
+
+    if result and result.get("success"):
+        try:
+            with shelve.open(CACHE_PATH) as cache:
+                cache[key] = (time.time(), result)
+        except CACHE_ERRORS:
+            pass
+
+    return result
@@ -0,0 +1,88 @@
+"""
+Shared KDM client helpers for test scripts
+
+Opens one MCP session per run so every query in a script reuses the same
+SSE connection instead of repeating the connect/initialize handshake, and
+retries transient failures so they are not mistaken for real ones.
+"""
+
+import asyncio
+import random
+import sys
+from contextlib import asynccontextmanager
+from pathlib import Path
+from typing import AsyncIterator, Awaitable, Callable, Optional, Tuple, Type, TypeVar
+
+# Add src to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+from kdm_sdk.client import KDMClient
+
+T = TypeVar("T")
+
+# Errors worth retrying: connection drops and timeouts, not bad arguments
+TRANSIENT_ERRORS = (TimeoutError, ConnectionError, asyncio.TimeoutError)
+
+
+@asynccontextmanager
+async def kdm_session(**client_kwargs) -> AsyncIterator[KDMClient]:
+    """
+    Yield a connected KDMClient and disconnect it on exit
+
+    Args:
+        **client_kwargs: Passed through to KDMClient (e.g. server_url, timeout).
+            KDMClient's own per-call timeout (30s by default) caps any longer
+            timeout given to with_retry, so raise both together.
+
+    Example:
+        async with kdm_session() as client:
+            result = await client.get_water_data(site_name="소양강댐", days=3)
+    """
+    client = KDMClient(**client_kwargs)
+    await client.connect()
+    try:
+        yield client
+    finally:
+        await client.disconnect()
+
+
+async def with_retry(
+    coro_factory: Callable[[], Awaitable[T]],
+    attempts: int = 3,
+    base: float = 0.5,
+    timeout: Optional[float] = None,
+    retry_on: Tuple[Type[BaseException], ...] = TRANSIENT_ERRORS,
+) -> T:
+    """
+    Await coro_factory(), retrying transient failures with exponential backoff
+
+    Waits ``base * 2**i`` seconds (plus a little jitter) between attempts.
+    The timeout applies to each attempt rather than the whole call, so an
+    attempt that hangs is retried like any other timeout. Errors outside
+    ``retry_on`` such as ValueError propagate immediately so bugs in the
+    test cases still surface.
+
+    Args:
+        coro_factory: Zero-argument callable returning a fresh awaitable
+        attempts: Total number of attempts
+        base: Initial backoff delay in seconds
+        timeout: Seconds to wait for each attempt (None waits indefinitely)
+        retry_on: Exception types worth another attempt; pass
+            ``(ConnectionError,)`` when a timeout is itself the answer
+
+    Example:
+        result = await with_retry(
+            lambda: client.get_water_data(site_name="소양강댐"), timeout=30.0
+        )
+    """
+    if attempts < 1:
+        raise ValueError("attempts must be at least 1")
+
+    for i in range(attempts):
+        try:
+            return await asyncio.wait_for(coro_factory(), timeout=timeout)
+        except retry_on:
+            if i == attempts - 1:
+                raise
+            await asyncio.sleep(base * 2**i + random.random() * 0.1)
+    raise AssertionError("unreachable")
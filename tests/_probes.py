@@ -0,0 +1,158 @@
+"""
+Shared probe helpers for the period and time_key test scripts
+
+Each helper takes a ``fetch`` callable with the get_water_data signature, so
+a script chooses between the live client (``client.get_water_data``) and
+the on-disk cache (``functools.partial(cached_get_water_data, client)``)
+and passes its query arguments through unchanged.
+"""
+
+import asyncio
+import statistics
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from _client import with_retry
+
+# Period probes measure timeouts, so only a dropped connection is retried
+PERIOD_RETRY_ON = (ConnectionError,)
+
+Fetch = Callable[..., Awaitable[Dict[str, Any]]]
+
+
+async def probe_time_key(
+    fetch: Fetch, time_key: str, timeout: float = 30.0, **query
+) -> Tuple[str, Optional[Dict[str, Any]], Optional[Exception]]:
+    """
+    Query one time_key, returning (time_key, result, error)
+
+    Args:
+        fetch: get_water_data-like callable
+        time_key: Time key to probe
+        timeout: Seconds to wait for each attempt
+        **query: Remaining get_water_data arguments (site_name, days, ...)
+    """
+    try:
+        result = await with_retry(
+            lambda: fetch(time_key=time_key, count_only=True, **query), timeout=timeout
+        )
+        return time_key, result, None
+    except Exception as e:
+        return time_key, None, e
+
+
+async def check_period(
+    fetch: Fetch, days: int, timeout: float = 30.0, **query
+) -> Tuple[bool, int, float, bool]:
+    """
+    Test a specific number of days and measure response time
+
+    Returns (works, data_count, elapsed_time, timed_out). A request still
+    running after ``timeout`` seconds counts as a failure and is not retried,
+    and elapsed_time covers only the final attempt, not earlier failures or
+    backoff.
+    """
+    start_time = time.perf_counter()
+
+    async def attempt():
+        nonlocal start_time
+        start_time = time.perf_counter()
+        return await fetch(days=days, count_only=True, **query)
+
+    try:
+        result = await with_retry(attempt, timeout=timeout, retry_on=PERIOD_RETRY_ON)
+    except (asyncio.TimeoutError, TimeoutError):
+        return False, 0, time.perf_counter() - start_time, True
+    except Exception:
+        return False, 0, time.perf_counter() - start_time, False
+
+    elapsed_time = time.perf_counter() - start_time
+    if result and result.get("success"):
+        return True, result.get("total_count", 0), elapsed_time, False
+    return False, 0, elapsed_time, False
+
+
+def timing_stats(times: List[float]) -> Dict[str, float]:
+    """Summarize response times as min/p50/p95/max"""
+    # The default "exclusive" method extrapolates past the largest sample on
+    # the handful of probes a search makes; "inclusive" stays within range.
+    # quantiles() needs at least two points; a single probe is its own p95
+    if len(times) > 1:
+        p95 = statistics.quantiles(times, n=20, method="inclusive")[18]
+    else:
+        p95 = times[0]
+    return {
+        "min": min(times),
+        "p50": statistics.median(times),
+        "p95": p95,
+        "max": max(times),
+    }
+
+
+def print_timing_stats(times: List[float]) -> None:
+    """Print min/p50/p95/max of the collected response times"""
+    if not times:
+        return
+    stats = timing_stats(times)
+    print(
+        f"⏱ 응답 시간 ({len(times)}회): p50={stats['p50']:.2f}s  "
+        f"p95={stats['p95']:.2f}s  min={stats['min']:.2f}s  max={stats['max']:.2f}s"
+    )
+
+
+async def find_max_period(
+    fetch: Fetch,
+    lo: int,
+    hi: int,
+    tolerance_days: int,
+    timeout: float = 30.0,
+    elapsed_by_days: Optional[Dict[int, float]] = None,
+    **query,
+) -> int:
+    """
+    Binary-search the largest working period within [lo, hi] days
+
+    Returns 0 if even ``lo`` fails, ``hi`` if it already works, otherwise the
+    largest period known to work (within ``tolerance_days`` of the limit).
+    Costs at most 2 + ceil(log2((hi - lo) / tolerance_days)) probes.
+
+    Args:
+        fetch: get_water_data-like callable
+        lo: Shortest period to try, in days
+        hi: Longest period to try, in days
+        tolerance_days: Stop once the limit is bracketed this tightly
+        timeout: Seconds to wait for each probe
+        elapsed_by_days: If given, filled with each probe's response time
+        **query: Remaining get_water_data arguments (site_name, time_key, ...)
+    """
+
+    async def probe(days):
+        works, count, elapsed, timed_out = await check_period(
+            fetch, days, timeout=timeout, **query
+        )
+        if elapsed_by_days is not None:
+            elapsed_by_days[days] = elapsed
+        if timed_out:
+            status, label = "⏱", "시간초과"
+        else:
+            status, label = ("✅", "성공") if works else ("❌", "실패")
+        print(
+            f"{status} {days:5}일 ({days/365:4.1f}년) - {label:4} - "
+            f"{count:5} 포인트 - {elapsed:6.2f}초"
+        )
+        return works
+
+    if await probe(hi):
+        return hi
+    if not await probe(lo):
+        return 0
+
+    # Invariant: lo works, hi fails
+    while hi - lo > tolerance_days:
+        mid = (lo + hi) // 2
+        if await probe(mid):
+            lo = mid
+        else:
+            hi = mid
+
+    return lo
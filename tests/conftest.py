@@ -9,12 +9,13 @@ from typing import List, Dict, Any
 
 
 @pytest.fixture
-async def kdm_client():
+async def kdm_client(request):
     """
     KDM 클라이언트 픽스처
 
     비동기 컨텍스트에서 KDM 클라이언트를 생성하고 반환합니다.
     테스트 종료 시 자동으로 연결을 종료합니다.
+    테스트 모듈에 TIMEOUT(초)이 있으면 클라이언트 타임아웃으로 사용합니다.
 
     Yields:
         KDMClient: 연결된 KDM 클라이언트 인스턴스
@@ -24,18 +25,21 @@ async def kdm_client():
             result = await kdm_client.get_facility_data(...)
             assert result is not None
     """
-    # 클라이언트 모듈이 아직 구현되지 않았으므로 mock 반환
-    # Agent B가 구현 후 실제 클라이언트로 교체
     try:
-        from kdm_sdk.client import KDMClient
-
-        client = KDMClient(server_url="http://203.237.1.4:8080/sse")
-        await client.connect()
-        yield client
-        await client.disconnect()
+        from _client import kdm_session
     except ImportError:
-        # 모듈이 아직 없으면 None 반환
+        # 의존성(mcp)이 없으면 None 반환
         yield None
+        return
+
+    client_kwargs = {"server_url": "http://203.237.1.4:8080/sse"}
+    # 모듈의 TIMEOUT이 클라이언트 기본값(30초)에 묶이지 않도록 전달
+    timeout = getattr(request.module, "TIMEOUT", None)
+    if timeout is not None:
+        client_kwargs["timeout"] = timeout
+
+    async with kdm_session(**client_kwargs) as client:
+        yield client
 
 
 @pytest.fixture
@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Verify water quality data retrieval with detailed output
+
+Run with: python tests/manual_verify_water_quality.py
+"""
+import asyncio
+
+from _cache import cached_get_water_data
+from _client import kdm_session, with_retry
+
+async def fetch(client, station, timeout=30.0):
+    """Fetch one year of TOC data, returning the exception instead of raising"""
+    try:
+        result = await with_retry(
+            lambda: cached_get_water_data(
+                client,
+                site_name=station,
+                facility_type="water_quality",
+                measurement_items=["TOC"],
+                time_key="mt_1",
+                days=365  # 1년치
+            ),
+            timeout=timeout
+        )
+        return station, result
+    except Exception as e:
+        return station, e
+
+async def verify_water_quality(timeout=30.0):
+    """Query each station and print what comes back, waiting up to ``timeout`` seconds"""
+    print("=" * 80)
+    print("수질 데이터 실제 조회 테스트")
+    print("=" * 80)
+    print()
+
+    # Test different water quality stations
+    stations = [
+        "소양강댐1",
+        "팔당댐",
+        "청평"
+    ]
+
+    # Query all stations in parallel, then print grouped per station
+    async with kdm_session(timeout=timeout) as client:
+        results = await asyncio.gather(*(fetch(client, s, timeout=timeout) for s in stations))
+
+    for station, result in results:
+        print(f"시설: {station}")
+        print("-" * 80)
+
+        if isinstance(result, (asyncio.TimeoutError, TimeoutError)):
+            print("⏱ 시간초과: 응답 없음")
+        elif isinstance(result, Exception):
+            print(f"❌ 오류 발생: {str(result)}")
+        elif result and result.get('success'):
+            data = result.get('data', [])
+            print(f"✅ 성공! {len(data)}개 데이터 포인트")
+
+            if data:
+                print(f"\n실제 데이터 구조 확인:")
+                print(f"  첫 번째 항목: {data[0]}")
+                print(f"\n실제 데이터 샘플 (최근 3개):")
+                for item in data[-3:]:
+                    # Try different possible field names
+                    date = item.get('tm') or item.get('time') or item.get('date') or item.get('measureDate', 'N/A')
+                    value = item.get('value') or item.get('val') or item.get('TOC', 'N/A')
+                    print(f"  {item}")
+            else:
+                print("  데이터는 있으나 비어있음")
+        else:
+            print(f"❌ 실패 또는 데이터 없음")
+            print(f"  응답: {result}")
+
+        print()
+
+if __name__ == "__main__":
+    asyncio.run(verify_water_quality())
@@ -248,6 +248,64 @@ async def test_disconnect_idempotent():
     assert not client.is_connected()
 
 
+@pytest.mark.asyncio
+async def test_get_water_data_count_only(monkeypatch):
+    """count_only 옵션 테스트"""
+    client = KDMClient()
+
+    async def mock_call_tool(name, arguments, timeout=None):
+        return {"success": True, "data": [{"value": 1}, {"value": 2}, {"value": 3}]}
+
+    monkeypatch.setattr(client, "_call_tool", mock_call_tool)
+
+    result = await client.get_water_data(site_name="소양강댐", days=3, count_only=True)
+
+    assert result["success"] is True
+    assert result["total_count"] == 3
+    assert "data" not in result
+
+
+@pytest.mark.asyncio
+async def test_get_water_data_auto_fallback_arguments(monkeypatch):
+    """자동 폴백 시 도구 인자 구성 테스트"""
+    client = KDMClient()
+    calls = []
+
+    async def mock_call_tool(name, arguments, timeout=None):
+        calls.append(arguments)
+        if arguments["time_key"] == "d_1":
+            return {"success": True, "data": [{"value": 1}]}
+        return {"success": True, "data": []}
+
+    monkeypatch.setattr(client, "_call_tool", mock_call_tool)
+
+    result = await client.get_water_data(
+        site_name="소양강댐",
+        measurement_items=["저수율"],
+        time_key="auto",
+        include_flood=True,
+    )
+
+    assert result["used_time_key"] == "d_1"
+    assert [c["time_key"] for c in calls] == ["h_1", "d_1"]
+    for c in calls:
+        assert c["site_name"] == "소양강댐"
+        assert c["measurement_items"] == ["저수율"]
+        assert c["include_flood"] is True
+        assert "include_drought" not in c
+
+
+def test_json_loads_handles_nan():
+    """응답 JSON 디코딩 테스트 (orjson 미지원 NaN 포함)"""
+    import math
+    from kdm_sdk.client import _json_loads
+
+    assert _json_loads('{"success": true, "data": [1, 2]}') == {"success": True, "data": [1, 2]}
+
+    result = _json_loads('{"value": NaN}')
+    assert math.isnan(result["value"])
+
+
 # Cleanup fixture
 @pytest.fixture(autouse=True)
 async def cleanup():
@@ -1,27 +1,59 @@
-#!/usr/bin/env python3
 """
 Test script to verify which facility names actually work with KDM MCP server
+
+These tests require a running KDM MCP Server at http://203.237.1.4:8080
+and print a report of their findings; run them with ``pytest -s`` to see it.
 """
+
 import asyncio
-import sys
-sys.path.insert(0, '/home/claudeuser/kdm-sdk/src')
+from collections import defaultdict
+
+import pytest
+
+from _cache import cached_get_water_data
+
+try:
+    from _client import with_retry
+except ImportError as e:
+    # Skip all tests if imports fail (dependencies not installed)
+    pytest.skip(f"Cannot import kdm_sdk modules: {e}", allow_module_level=True)
 
-from kdm_sdk.client import KDMClient
+# These tests talk to the live MCP server
+pytestmark = [pytest.mark.integration, pytest.mark.requires_server]
 
-async def test_facility_name(client, site_name, facility_type, measurement_item):
-    """Test if a facility name works"""
+# Korean display names for facility types
+TYPE_NAMES = {
+    'dam': '댐',
+    'water_level': '수위관측소',
+    'rainfall': '우량관측소',
+    'weather': '기상관측소',
+    'water_quality': '수질관측소'
+}
+
+# Seconds to wait for each facility query
+TIMEOUT = 30.0
+
+async def check_facility_name(client, site_name, facility_type, measurement_item, timeout=30.0):
+    """Test if a facility name works, giving up after ``timeout`` seconds"""
     try:
-        result = await client.get_water_data(
-            site_name=site_name,
-            facility_type=facility_type,
-            measurement_items=[measurement_item],
-            time_key="d_1",
-            days=3
+        result = await with_retry(
+            lambda: cached_get_water_data(
+                client,
+                site_name=site_name,
+                facility_type=facility_type,
+                measurement_items=[measurement_item],
+                time_key="d_1",
+                days=3,
+                count_only=True
+            ),
+            timeout=timeout,
+            # A timeout is a result here; retrying it would hold a semaphore slot
+            retry_on=(ConnectionError,)
         )
 
         if result and isinstance(result, dict):
             success = result.get('success', False)
-            data_count = len(result.get('data', [])) if result.get('data') else 0
+            data_count = result.get('total_count', 0)
             return {
                 'name': site_name,
                 'type': facility_type,
@@ -37,6 +69,14 @@ async def test_facility_name(client, site_name, facility_type, measurement_item)
                 'data_points': 0,
                 'status': '❌ FAIL'
             }
+    except (asyncio.TimeoutError, TimeoutError):
+        return {
+            'name': site_name,
+            'type': facility_type,
+            'works': False,
+            'error': f"No response within {timeout}s",
+            'status': '⏱ TIMEOUT'
+        }
     except Exception as e:
         return {
             'name': site_name,
@@ -46,15 +86,14 @@ async def test_facility_name(client, site_name, facility_type, measurement_item)
             'status': '❌ ERROR'
         }
 
-async def main():
+@pytest.mark.asyncio
+async def test_facility_names(kdm_client):
+    """Report which facility name variants the MCP server accepts"""
     print("=" * 80)
     print("KDM Facility Name Verification Test")
     print("=" * 80)
     print()
 
-    client = KDMClient()
-    await client.connect()
-
     # Test cases: (site_name, facility_type, measurement_item)
     test_cases = [
         # === 댐 (Dam) ===
@@ -105,19 +144,25 @@ async def main():
         ("팔당댐수질", "water_quality", "TOC"),
     ]
 
-    results = []
-    for site_name, facility_type, measurement in test_cases:
-        print(f"Testing: {site_name:25} ({facility_type})... ", end='', flush=True)
-        result = await test_facility_name(client, site_name, facility_type, measurement)
-        results.append(result)
-        print(result['status'])
+    # Run all cases concurrently; the semaphore keeps us polite to the server
+    sem = asyncio.Semaphore(8)
+
+    async def run(test_case):
+        site_name, facility_type, measurement = test_case
+        async with sem:
+            result = await check_facility_name(
+                kdm_client, site_name, facility_type, measurement, timeout=TIMEOUT
+            )
+        # Print the whole block at once so concurrent output doesn't interleave
+        lines = [f"Testing: {site_name:25} ({facility_type})... {result['status']}"]
         if 'error' in result:
-            print(f"  Error: {result['error']}")
+            lines.append(f"  Error: {result['error']}")
         elif result['works']:
-            print(f"  Data points: {result['data_points']}")
-        await asyncio.sleep(0.5)  # Be nice to the server
+            lines.append(f"  Data points: {result['data_points']}")
+        print("\n".join(lines), flush=True)
+        return result
 
-    await client.disconnect()
+    results = await asyncio.gather(*(run(tc) for tc in test_cases))
 
     print()
     print("=" * 80)
@@ -125,8 +170,17 @@ async def main():
     print("=" * 80)
     print()
 
-    working = [r for r in results if r['works']]
-    failed = [r for r in results if not r['works']]
+    # Split results and group names by facility type in a single pass
+    working, failed = [], []
+    working_by_type = defaultdict(list)
+    failed_by_type = defaultdict(list)
+    for r in results:
+        if r['works']:
+            working.append(r)
+            working_by_type[r['type']].append(r['name'])
+        else:
+            failed.append(r)
+            failed_by_type[r['type']].append(r['name'])
 
     print(f"✅ Working: {len(working)}")
     for r in working:
@@ -143,45 +197,23 @@ async def main():
     print("=" * 80)
     print()
 
-    # Group by facility type
-    by_type = {}
-    for r in working:
-        ftype = r['type']
-        if ftype not in by_type:
-            by_type[ftype] = []
-        by_type[ftype].append(r['name'])
-
-    type_names = {
-        'dam': '댐',
-        'water_level': '수위관측소',
-        'rainfall': '우량관측소',
-        'weather': '기상관측소',
-        'water_quality': '수질관측소'
-    }
-
-    for ftype, names in sorted(by_type.items()):
-        korean_name = type_names.get(ftype, ftype)
+    for ftype, names in sorted(working_by_type.items()):
+        korean_name = TYPE_NAMES.get(ftype, ftype)
         print(f"✅ {korean_name} ({len(names)}개 작동):")
         for name in names:
             print(f"   - {name}")
         print()
 
     # Show failed by type
-    failed_by_type = {}
-    for r in failed:
-        ftype = r['type']
-        if ftype not in failed_by_type:
-            failed_by_type[ftype] = []
-        failed_by_type[ftype].append(r['name'])
-
     if failed_by_type:
         print("❌ 작동하지 않는 시설명:")
         for ftype, names in sorted(failed_by_type.items()):
-            korean_name = type_names.get(ftype, ftype)
+            korean_name = TYPE_NAMES.get(ftype, ftype)
             print(f"   {korean_name}:")
             for name in names:
                 print(f"      - {name}")
         print()
 
-if __name__ == "__main__":
-    asyncio.run(main())
+    # The reference dams must always resolve
+    for name in ["소양강댐", "충주댐", "대청댐", "안동댐"]:
+        assert name in working_by_type['dam'], f"{name} should return data"
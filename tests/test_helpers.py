@@ -0,0 +1,132 @@
+"""
+Tests for the shared test-script helpers (_cache, _client, _probes)
+"""
+
+import asyncio
+
+import pytest
+
+import _cache
+from _cache import cached_get_water_data
+
+
+class FakeClient:
+    """Stands in for KDMClient, counting get_water_data calls"""
+
+    server_url = "http://fake/sse"
+
+    def __init__(self):
+        self.calls = 0
+
+    async def get_water_data(self, **kwargs):
+        self.calls += 1
+        return {"success": True, "total_count": kwargs.get("days", 0)}
+
+
+@pytest.mark.asyncio
+async def test_cached_get_water_data_serves_repeats(monkeypatch, tmp_path):
+    """반복 조회 캐시 적중 테스트"""
+    monkeypatch.setattr(_cache, "CACHE_PATH", str(tmp_path / "cache"))
+    client = FakeClient()
+
+    first = await cached_get_water_data(client, site_name="소양강댐", days=3)
+    second = await cached_get_water_data(client, site_name="소양강댐", days=3)
+
+    assert first == second == {"success": True, "total_count": 3}
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_get_water_data_falls_through_on_cache_error(
+    monkeypatch, tmp_path
+):
+    """캐시 파일 오류 시 서버 조회 테스트"""
+    # A path under a missing directory cannot be opened or created
+    monkeypatch.setattr(_cache, "CACHE_PATH", str(tmp_path / "missing" / "cache"))
+    client = FakeClient()
+
+    result = await cached_get_water_data(client, site_name="소양강댐", days=3)
+
+    assert result == {"success": True, "total_count": 3}
+    assert client.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_with_retry_times_out_each_attempt():
+    """시도별 시간초과 후 재시도 테스트"""
+    with_retry = pytest.importorskip("_client").with_retry
+    attempts = []
+
+    async def hangs_then_succeeds():
+        attempts.append(1)
+        if len(attempts) == 1:
+            await asyncio.sleep(10)
+        return "ok"
+
+    result = await with_retry(hangs_then_succeeds, base=0.01, timeout=0.05)
+
+    assert result == "ok"
+    assert len(attempts) == 2
+
+
+@pytest.mark.asyncio
+async def test_with_retry_does_not_retry_bugs():
+    """비일시적 오류 즉시 전파 테스트"""
+    with_retry = pytest.importorskip("_client").with_retry
+    attempts = []
+
+    async def broken():
+        attempts.append(1)
+        raise ValueError("bad arguments")
+
+    with pytest.raises(ValueError):
+        await with_retry(broken, base=0.01)
+    assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+async def test_with_retry_leaves_timeouts_outside_retry_on():
+    """retry_on 밖의 시간초과 즉시 전파 테스트"""
+    with_retry = pytest.importorskip("_client").with_retry
+    attempts = []
+
+    async def hangs():
+        attempts.append(1)
+        await asyncio.sleep(10)
+
+    with pytest.raises(asyncio.TimeoutError):
+        await with_retry(hangs, base=0.01, timeout=0.05, retry_on=(ConnectionError,))
+    assert len(attempts) == 1
+
+
+@pytest.mark.asyncio
+async def test_check_period_times_final_attempt_only():
+    """기간 조회 응답 시간이 마지막 시도만 포함하는지 테스트"""
+    check_period = pytest.importorskip("_probes").check_period
+    attempts = []
+
+    async def drops_then_answers(**kwargs):
+        attempts.append(1)
+        if len(attempts) == 1:
+            await asyncio.sleep(0.3)
+            raise ConnectionError("connection dropped")
+        return {"success": True, "total_count": kwargs["days"]}
+
+    works, count, elapsed, timed_out = await check_period(drops_then_answers, 30)
+
+    assert (works, count, timed_out) == (True, 30, False)
+    assert len(attempts) == 2
+    assert elapsed < 0.3
+
+
+@pytest.mark.parametrize(
+    "times", [[1.0, 2.0, 3.0], [1.0, 2.0, 3.0, 4.0, 5.0], [0.4, 9.0, 0.5]]
+)
+def test_timing_stats_stays_within_samples(times):
+    """적은 표본의 응답 시간 통계 범위 테스트"""
+    timing_stats = pytest.importorskip("_probes").timing_stats
+
+    stats = timing_stats(times)
+
+    assert stats["min"] <= stats["p50"] <= stats["p95"] <= stats["max"]
+    assert stats["max"] == max(times)
@@ -0,0 +1,46 @@
+"""
+Test maximum period limits for d_1 time key with response time measurement
+
+These tests require a running KDM MCP Server at http://203.237.1.4:8080
+and print a report of their findings; run them with ``pytest -s`` to see it.
+"""
+
+import pytest
+
+try:
+    from _probes import find_max_period, print_timing_stats
+except ImportError as e:
+    # Skip all tests if imports fail (dependencies not installed)
+    pytest.skip(f"Cannot import kdm_sdk modules: {e}", allow_module_level=True)
+
+# These tests talk to the live MCP server
+pytestmark = [pytest.mark.integration, pytest.mark.requires_server, pytest.mark.slow]
+
+# Seconds to wait for each probe
+TIMEOUT = 30.0
+
+
+@pytest.mark.asyncio
+async def test_max_period(kdm_client):
+    """Find the longest d_1 period the server serves and how long it takes"""
+    print("=" * 80)
+    print("d_1 (일별 데이터) 최대 기간 테스트 - 응답 시간 측정")
+    print("=" * 80)
+    print()
+
+    # Search between 1 and 30 years, stopping within 5 years of the limit
+    # (at most 5 probes, the same cost and resolution as stepping 10..30 years)
+    elapsed_by_days = {}
+    max_days = await find_max_period(
+        kdm_client.get_water_data, lo=365, hi=10950, tolerance_days=1825,
+        timeout=TIMEOUT, elapsed_by_days=elapsed_by_days,
+        site_name="소양강댐", facility_type="dam", measurement_items=["저수율"], time_key="d_1"
+    )
+
+    print()
+    print("=" * 80)
+    print(f"📊 결과: d_1 최대 기간은 {max_days}일 ({max_days/365:.1f}년)")
+    print_timing_stats(list(elapsed_by_days.values()))
+    print("=" * 80)
+
+    assert max_days > 0, "d_1 should work for at least one year"
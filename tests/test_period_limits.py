@@ -0,0 +1,75 @@
+"""
+Test to verify actual period limits for each time_key
+
+These tests require a running KDM MCP Server at http://203.237.1.4:8080
+and print a report of their findings; run them with ``pytest -s`` to see it.
+"""
+
+import pytest
+
+try:
+    from _probes import find_max_period, print_timing_stats
+except ImportError as e:
+    # Skip all tests if imports fail (dependencies not installed)
+    pytest.skip(f"Cannot import kdm_sdk modules: {e}", allow_module_level=True)
+
+# These tests talk to the live MCP server
+pytestmark = [pytest.mark.integration, pytest.mark.requires_server, pytest.mark.slow]
+
+# Seconds to wait for each probe
+TIMEOUT = 30.0
+
+# Query probed for each time_key
+QUERY = {"site_name": "소양강댐", "facility_type": "dam", "measurement_items": ["저수율"]}
+
+
+@pytest.mark.asyncio
+async def test_period_limits(kdm_client):
+    """Find the longest h_1 and d_1 periods the server serves"""
+    print("=" * 70)
+    print("Testing Period Limits for KDM API")
+    print("=" * 70)
+    print()
+
+    # Test h_1 (hourly) limits: 1 week ~ 1 year, within a month (at most 6 probes)
+    print("시간별 데이터 (h_1) 제한 테스트:")
+    print("-" * 70)
+    # Query the server directly: cache hits would report near-zero times
+    fetch = kdm_client.get_water_data
+    h1_elapsed = {}
+    h1_max = await find_max_period(
+        fetch, lo=7, hi=365, tolerance_days=30, timeout=TIMEOUT,
+        elapsed_by_days=h1_elapsed,
+        time_key="h_1", **QUERY
+    )
+
+    print()
+    print(f"💡 h_1 최대 기간: 약 {h1_max}일 ({h1_max//30}개월)")
+    print_timing_stats(list(h1_elapsed.values()))
+    print()
+
+    # Test d_1 (daily) limits: 1 month ~ 6 years, within a month (at most 9 probes)
+    print("일별 데이터 (d_1) 제한 테스트:")
+    print("-" * 70)
+    d1_elapsed = {}
+    d1_max = await find_max_period(
+        fetch, lo=30, hi=2190, tolerance_days=30, timeout=TIMEOUT,
+        elapsed_by_days=d1_elapsed,
+        time_key="d_1", **QUERY
+    )
+
+    print()
+    print(f"💡 d_1 최대 기간: 약 {d1_max}일 ({d1_max/365:.1f}년)")
+    print_timing_stats(list(d1_elapsed.values()))
+    print()
+
+    print("=" * 70)
+    print("결론:")
+    print("=" * 70)
+    print(f"• 시간별 (h_1): 최대 {h1_max}일 (약 {h1_max//30}개월)")
+    print(f"• 일별   (d_1): 최대 {d1_max}일 (약 {d1_max/365:.1f}년)")
+    print(f"• 10분   (min_10): 지원 안함 ❌")
+    print(f"• 월별   (mt_1): 작동 안함 ❌")
+
+    assert h1_max > 0, "h_1 should work for at least a week"
+    assert d1_max > 0, "d_1 should work for at least a month"
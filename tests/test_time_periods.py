@@ -0,0 +1,58 @@
+"""
+Test to verify which time periods are actually available
+
+These tests require a running KDM MCP Server at http://203.237.1.4:8080
+and print a report of their findings; run them with ``pytest -s`` to see it.
+"""
+
+import asyncio
+from functools import partial
+
+import pytest
+
+from _cache import cached_get_water_data
+
+try:
+    from _probes import probe_time_key
+except ImportError as e:
+    # Skip all tests if imports fail (dependencies not installed)
+    pytest.skip(f"Cannot import kdm_sdk modules: {e}", allow_module_level=True)
+
+# These tests talk to the live MCP server
+pytestmark = [pytest.mark.integration, pytest.mark.requires_server]
+
+# Seconds to wait for each time_key
+TIMEOUT = 30.0
+
+# Query probed for each time_key
+QUERY = {"site_name": "소양강댐", "facility_type": "dam", "measurement_items": ["저수율"], "days": 3}
+
+
+@pytest.mark.asyncio
+async def test_time_periods(kdm_client):
+    """Report which time_keys return dam data"""
+    # Test different time periods
+    time_keys = ["min_10", "h_1", "d_1", "mt_1"]
+
+    print("Testing available time periods for 소양강댐...")
+    print("=" * 60)
+
+    # The probes are independent, so run them all at once
+    fetch = partial(cached_get_water_data, kdm_client)
+    outcomes = await asyncio.gather(
+        *(probe_time_key(fetch, tk, timeout=TIMEOUT, **QUERY) for tk in time_keys)
+    )
+
+    for time_key, result, error in outcomes:
+        if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+            print(f"⏱ {time_key:8} - Timeout")
+        elif error is not None:
+            print(f"❌ {time_key:8} - Error: {str(error)[:50]}")
+        elif result and result.get('success'):
+            data_count = result.get('total_count', 0)
+            print(f"✅ {time_key:8} - Works! ({data_count} data points)")
+        else:
+            print(f"❌ {time_key:8} - No data or failed")
+
+    d1_result = {tk: result for tk, result, _ in outcomes}["d_1"]
+    assert d1_result and d1_result.get('success'), "d_1 should return dam data"
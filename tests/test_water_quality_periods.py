@@ -0,0 +1,68 @@
+"""
+Test time periods for water quality stations
+
+These tests require a running KDM MCP Server at http://203.237.1.4:8080
+and print a report of their findings; run them with ``pytest -s`` to see it.
+"""
+
+import asyncio
+from functools import partial
+
+import pytest
+
+from _cache import cached_get_water_data
+
+try:
+    from _probes import probe_time_key
+except ImportError as e:
+    # Skip all tests if imports fail (dependencies not installed)
+    pytest.skip(f"Cannot import kdm_sdk modules: {e}", allow_module_level=True)
+
+# These tests talk to the live MCP server
+pytestmark = [pytest.mark.integration, pytest.mark.requires_server]
+
+# Seconds to wait for each time_key
+TIMEOUT = 30.0
+
+# Query probed for each time_key
+QUERY = {
+    "site_name": "소양강댐1",
+    "facility_type": "water_quality",
+    "measurement_items": ["TOC"],
+    "days": 90,
+}
+
+
+@pytest.mark.asyncio
+async def test_water_quality_periods(kdm_client):
+    """Report which time_keys return water quality data"""
+    # Test water quality station
+    time_keys = ["min_10", "h_1", "d_1", "mt_1"]
+
+    print("=" * 70)
+    print("수질관측소 시간 단위 테스트")
+    print("=" * 70)
+    print()
+
+    # The probes are independent, so run them all at once
+    fetch = partial(cached_get_water_data, kdm_client)
+    outcomes = await asyncio.gather(
+        *(probe_time_key(fetch, tk, timeout=TIMEOUT, **QUERY) for tk in time_keys)
+    )
+
+    for time_key, result, error in outcomes:
+        if isinstance(error, (asyncio.TimeoutError, TimeoutError)):
+            print(f"⏱ {time_key:8} - 시간초과")
+        elif error is not None:
+            print(f"❌ {time_key:8} - 오류: {str(error)[:50]}")
+        elif result and result.get('success'):
+            data_count = result.get('total_count', 0)
+            print(f"✅ {time_key:8} - 작동! ({data_count} data points)")
+        else:
+            print(f"❌ {time_key:8} - 데이터 없음")
+
+    print()
+    print("=" * 70)
+
+    assert any(result and result.get('success') for _, result, _ in outcomes), \
+        "At least one time_key should return water quality data"